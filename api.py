@@ -1,11 +1,79 @@
 from flask import Flask, request, jsonify, Response
-import aiohttp
+from flask.json.provider import DefaultJSONProvider
 import asyncio
+import base64
+import functools
+import gzip
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
 from urllib.parse import parse_qs, urlparse
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import profiling
+from auth import is_admin_request
+
+# Upstream HTTP client, imported by `init_upstream()` on the first
+# upstream-bound request so cold starts and the lightweight routes (`/`,
+# `/health`) do not pay for it.
+aiohttp: Any = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_orjson() -> Any:
+    """Import orjson on first use; None when it is not installed."""
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    return orjson
+
+
+@functools.lru_cache(maxsize=None)
+def _get_brotli() -> Any:
+    """Import brotli on first use; None when it is not installed."""
+    try:
+        import brotli  # type: ignore
+    except ImportError:
+        return None
+    return brotli
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson when it is installed.
+
+    Only `dumps` is overridden, so `jsonify` responses are built by the
+    default provider. Keys are emitted in insertion order and without
+    indentation. Falls back to the stdlib-based default provider when orjson
+    is missing or when custom `json.dumps` keyword arguments are passed.
+    """
+
+    sort_keys = False
+    compact = True
+    # Match orjson, which always emits UTF-8 rather than \u escapes
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        orjson = _get_orjson()
+        # orjson output is always compact, so the `separators` Flask passes
+        # for compact responses needs no special handling.
+        if orjson is None or set(kwargs) - {"separators"}:
+            return super().dumps(obj, **kwargs)
+        # Dates and dataclasses are passed through to `default` so they are
+        # serialized exactly as the stdlib provider would.
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=(
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            ),
+        ).decode("utf-8")
 
 
 def create_app() -> Flask:
@@ -16,6 +84,7 @@ def create_app() -> Flask:
     """
 
     app = Flask(__name__, static_folder="public", static_url_path="/public")
+    app.json = FastJSONProvider(app)
 
     # Basic CORS for browser clients (no extra dependency)
     @app.after_request
@@ -30,6 +99,7 @@ def create_app() -> Flask:
 
 # Create module-level `app` so Vercel/Gunicorn can import it: `from api import app`
 app = create_app()
+profiling.init_app(app)
 
 
 # Basic CORS for browser clients (no extra dependency)
@@ -41,6 +111,68 @@ def add_cors_headers(resp: Response) -> Response:
     return resp
 
 
+# Responses smaller than this many bytes are sent uncompressed.
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported content encoding from an Accept-Encoding header"""
+    accepted: Dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+
+    def allowed(name: str) -> bool:
+        return accepted.get(name, accepted.get("*", 0.0)) > 0
+
+    if allowed("br") and _get_brotli() is not None:
+        return "br"
+    if allowed("gzip"):
+        return "gzip"
+    return None
+
+
+@app.after_request
+def compress_response(resp: Response) -> Response:
+    """Compress JSON responses with brotli or gzip based on Accept-Encoding"""
+    if (
+        resp.direct_passthrough
+        or not (200 <= resp.status_code < 300)
+        or "Content-Encoding" in resp.headers
+        or resp.mimetype != "application/json"
+    ):
+        return resp
+
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+    resp.vary.add("Accept-Encoding")
+    if not encoding:
+        return resp
+
+    data = resp.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return resp
+
+    if encoding == "br":
+        data = _get_brotli().compress(data, quality=min(COMPRESS_LEVEL, 11))
+    else:
+        data = gzip.compress(data, compresslevel=min(COMPRESS_LEVEL, 9))
+
+    resp.set_data(data)
+    resp.headers["Content-Encoding"] = encoding
+    return resp
+
+
 ALLOWED_HOSTS: set[str] = {
     "terabox.app",
     "www.terabox.app",
@@ -145,6 +277,63 @@ def load_cookies() -> dict[str, str]:
     return {}
 
 
+# Set LAZY_INIT=0 to import upstream dependencies and load cookies at import
+# time instead of on the first upstream-bound request.
+LAZY_INIT = os.getenv("LAZY_INIT", "1") != "0"
+
+# Loaded cookies are reused for COOKIE_CACHE_TTL seconds, or until the
+# TERABOX_COOKIES_FILE changes. A failed (empty) load is never cached.
+COOKIE_CACHE_TTL = int(os.getenv("COOKIE_CACHE_TTL", "300"))
+
+_cookies: Optional[Dict[str, str]] = None
+_cookies_loaded_at = 0.0
+_cookies_file_mtime: Optional[float] = None
+_upstream_ready = False
+
+
+def _cookie_file_mtime() -> Optional[float]:
+    file_path = os.getenv("TERABOX_COOKIES_FILE")
+    if not file_path:
+        return None
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+
+def get_cookies() -> Dict[str, str]:
+    """Return upstream cookies, reloading them when stale or changed."""
+    global _cookies, _cookies_loaded_at, _cookies_file_mtime
+    mtime = _cookie_file_mtime()
+    if (
+        _cookies is None
+        or time.time() - _cookies_loaded_at >= COOKIE_CACHE_TTL
+        or mtime != _cookies_file_mtime
+    ):
+        cookies = load_cookies()
+        if not cookies:
+            return cookies
+        _cookies, _cookies_loaded_at, _cookies_file_mtime = cookies, time.time(), mtime
+    return _cookies
+
+
+def init_upstream() -> None:
+    """Import aiohttp and load cookies on first use."""
+    global aiohttp, _upstream_ready
+    if _upstream_ready:
+        return
+
+    import aiohttp as _aiohttp
+
+    aiohttp = _aiohttp
+    get_cookies()
+    _upstream_ready = True
+
+
+if not LAZY_INIT:
+    init_upstream()
+
+
 headers: Dict[str, str] = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Accept": "*/*",
@@ -201,135 +390,324 @@ async def get_formatted_size(size_bytes: Union[int, str]) -> str:
         return "Unknown"
 
 
+SHARE_LIST_URL = "https://www.terabox.app/share/list"
+# Items per upstream /share/list page (default and upper bound for `num`).
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def extract_surl(url: str) -> Optional[str]:
+    """Extract the share id from a `?surl=` query or a `/s/` path"""
+    if "surl=" in url:
+        return url.split("surl=")[1].split("&")[0] or None
+    if "/s/" in url:
+        return url.split("/s/")[1].split("?")[0] or None
+    return None
+
+
+def share_id(url: str) -> str:
+    """Normalise a share URL to its surl for use as a cache key.
+
+    `/s/1XXX` links and `?surl=XXX` links (on any allowed host, with any
+    extra query parameters) map to the same id `XXX`.
+    """
+    if "surl=" in url:
+        return extract_surl(url) or url
+    surl = extract_surl(url)
+    if not surl:
+        return url
+    return surl[1:] if surl.startswith("1") and len(surl) > 1 else surl
+
+
+def same_share(surl_a: Optional[str], surl_b: Optional[str]) -> bool:
+    """Compare share ids; `/s/1XXX` links redirect to `surl=XXX`."""
+    if not surl_a or not surl_b:
+        return False
+    return surl_a == surl_b or surl_a == "1" + surl_b or "1" + surl_a == surl_b
+
+
+async def fetch_share_tokens(session: Any, url: str) -> Dict[str, Any]:
+    """Scrape the share page for the tokens required by /share/list"""
+    logging.info(f"Fetching share page: {url}")
+    async with session.get(url) as response1:
+        response1.raise_for_status()
+        response_data = await response1.text()
+        request_url = str(response1.url)
+
+    # Extract required tokens
+    js_token = find_between(response_data, "fn%28%22", "%22%29")
+    log_id = find_between(response_data, "dp-logid=", "&")
+
+    if not js_token or not log_id:
+        logging.error("Failed to extract required tokens")
+        return {
+            "error": "Failed to extract authentication tokens",
+            "errno": -1,
+        }
+
+    # Extract surl from URL
+    surl = extract_surl(request_url)
+    if not surl:
+        logging.error("Could not extract surl from URL")
+        return {"error": "Invalid URL format", "errno": -1}
+
+    logging.info(f"Extracted surl: {surl}, logid: {log_id}")
+    return {
+        "js_token": js_token,
+        "log_id": log_id,
+        "surl": surl,
+        "request_url": request_url,
+    }
+
+
+def share_list_params(
+    tokens: Dict[str, Any],
+    password: str = "",
+    page: int = 1,
+    num: int = DEFAULT_PAGE_SIZE,
+    dir_path: Optional[str] = None,
+) -> Dict[str, str]:
+    """Build /share/list query parameters for the root or a directory"""
+    params = {
+        "app_id": "250528",
+        "web": "1",
+        "channel": "dubox",
+        "clienttype": "0",
+        "jsToken": tokens["js_token"],
+        "dplogid": tokens["log_id"],
+        "page": str(page),
+        "num": str(num),
+        "site_referer": tokens["request_url"],
+        "shorturl": tokens["surl"],
+    }
+    if dir_path:
+        params.update({"dir": dir_path, "order": "asc", "by": "name"})
+    else:
+        params.update({"order": "time", "desc": "1", "root": "1"})
+    if password:
+        params["pwd"] = password
+    return params
+
+
+async def fetch_share_list(
+    session: Any, tokens: Dict[str, Any], params: Dict[str, str]
+) -> Dict[str, Any]:
+    """Request one /share/list page, mapping upstream errors to error dicts"""
+    # Update headers with the actual referer
+    session_headers = headers.copy()
+    session_headers["Referer"] = tokens["request_url"]
+
+    logging.info(f"Fetching file list from: {SHARE_LIST_URL}")
+    async with session.get(
+        SHARE_LIST_URL, params=params, headers=session_headers
+    ) as response:
+        data = await response.json()
+
+    errno = data.get("errno", -1)
+
+    # Handle verification required
+    if errno == 400141:
+        logging.warning("Link requires verification")
+        return {
+            "error": "Verification required",
+            "errno": 400141,
+            "message": "This link requires password or captcha verification",
+            "surl": tokens["surl"],
+            "requires_password": True,
+        }
+
+    # Handle other errors
+    if errno != 0:
+        error_msg = data.get("errmsg", "Unknown error")
+        logging.error(f"API error {errno}: {error_msg}")
+        return {"error": error_msg, "errno": errno}
+
+    # Check if we got the file list
+    if "list" not in data:
+        logging.error("No file list in response")
+        return {"error": "No files found in response", "errno": -1}
+
+    return data
+
+
 async def fetch_download_link(
     url: str, password: str = ""
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """Fetch file information from TeraBox share link"""
+    init_upstream()
     try:
-        cookies = load_cookies()
+        cookies = get_cookies()
         async with aiohttp.ClientSession(cookies=cookies, headers=headers) as session:
             # Step 1: Get the share page and extract tokens
-            logging.info(f"Fetching share page: {url}")
-            async with session.get(url) as response1:
-                response1.raise_for_status()
-                response_data = await response1.text()
-
-                # Extract required tokens
-                js_token = find_between(response_data, "fn%28%22", "%22%29")
-                log_id = find_between(response_data, "dp-logid=", "&")
-
-                # with open("log.txt", "w", encoding="utf-8") as f:
-                #     f.write(js_token + "\n" + log_id)
-
-                # with open("log-page.html", "w", encoding="utf-8") as f:
-                #     f.write(response_data)
+            tokens = await fetch_share_tokens(session, url)
+            if "error" in tokens:
+                return tokens
 
-                if not js_token or not log_id:
-                    logging.error("Failed to extract required tokens")
+            # Step 2: Fetch the root file list
+            response_data2 = await fetch_share_list(
+                session, tokens, share_list_params(tokens, password)
+            )
+            if "error" in response_data2:
+                return response_data2
+
+            files = response_data2["list"]
+            logging.info(f"Found {len(files)} items")
+
+            # Step 3: If it's a directory, fetch its contents
+            if files and files[0].get("isdir") == "1":
+                logging.info("Fetching directory contents")
+                response_data3 = await fetch_share_list(
+                    session,
+                    tokens,
+                    share_list_params(tokens, password, dir_path=files[0]["path"]),
+                )
+                if "error" in response_data3:
                     return {
-                        "error": "Failed to extract authentication tokens",
+                        "error": "Failed to fetch directory contents",
                         "errno": -1,
                     }
 
-                request_url = str(response1.url)
-
-                # Extract surl from URL
-                if "surl=" in request_url:
-                    surl = request_url.split("surl=")[1].split("&")[0]
-                elif "/s/" in request_url:
-                    surl = request_url.split("/s/")[1].split("?")[0]
-                else:
-                    logging.error("Could not extract surl from URL")
-                    return {"error": "Invalid URL format", "errno": -1}
-
-                logging.info(f"Extracted surl: {surl}, logid: {log_id}")
-
-                # Update headers with the actual referer
-                session_headers = headers.copy()
-                session_headers["Referer"] = request_url
-
-                params = {
-                    "app_id": "250528",
-                    "web": "1",
-                    "channel": "dubox",
-                    "clienttype": "0",
-                    "jsToken": js_token,
-                    "dplogid": log_id,
-                    "page": "1",
-                    "num": "20",
-                    "order": "time",
-                    "desc": "1",
-                    "site_referer": request_url,
-                    "shorturl": surl,
-                    "root": "1",
-                }
-                if password:
-                    params["pwd"] = password
-
-                list_url = "https://www.terabox.app/share/list"
-                logging.info(f"Fetching file list from: {list_url}")
-
-                async with session.get(
-                    list_url, params=params, headers=session_headers
-                ) as response2:
-                    response_data2 = await response2.json()
-
-                    errno = response_data2.get("errno", -1)
-
-                    # Handle verification required
-                    if errno == 400141:
-                        logging.warning("Link requires verification")
-                        return {
-                            "error": "Verification required",
-                            "errno": 400141,
-                            "message": "This link requires password or captcha verification",
-                            "surl": surl,
-                            "requires_password": True,
-                        }
-
-                    # Handle other errors
-                    if errno != 0:
-                        error_msg = response_data2.get("errmsg", "Unknown error")
-                        logging.error(f"API error {errno}: {error_msg}")
-                        return {"error": error_msg, "errno": errno}
+                files = response_data3["list"]
+                logging.info(f"Found {len(files)} files in directory")
 
-                    # Check if we got the file list
-                    if "list" not in response_data2:
-                        logging.error("No file list in response")
-                        return {"error": "No files found in response", "errno": -1}
+            return files
 
-                    files = response_data2["list"]
-                    logging.info(f"Found {len(files)} items")
+    except aiohttp.ClientResponseError as e:
+        logging.error(f"HTTP error: {e.status} - {e.message}")
+        return {"error": f"HTTP error: {e.status}", "errno": -1}
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}", exc_info=True)
+        return {"error": str(e), "errno": -1}
 
-                    # Step 3: If it's a directory, fetch its contents
-                    if files and files[0].get("isdir") == "1":
-                        logging.info("Fetching directory contents")
-                        params.update(
-                            {
-                                "dir": files[0]["path"],
-                                "order": "asc",
-                                "by": "name",
-                                "dplogid": log_id,
-                            }
-                        )
-                        params.pop("desc", None)
-                        params.pop("root", None)
 
-                        async with session.get(
-                            list_url, params=params, headers=session_headers
-                        ) as response3:
-                            response_data3 = await response3.json()
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode pagination state into an opaque URL-safe cursor"""
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
-                            if "list" not in response_data3:
-                                return {
-                                    "error": "Failed to fetch directory contents",
-                                    "errno": -1,
-                                }
 
-                            files = response_data3["list"]
-                            logging.info(f"Found {len(files)} files in directory")
+def decode_cursor(cursor: str) -> Optional[Dict[str, Any]]:
+    """Decode a cursor produced by encode_cursor; None if it is malformed.
 
-                    return files
+    Page and size are validated with the same bounds as the `page`/`num`
+    query parameters.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        return None
+    if not isinstance(state, dict):
+        return None
+    if any(not isinstance(state.get(k), str) or not state[k] for k in ("s", "r", "t", "l")):
+        return None
+    if "d" in state and not isinstance(state["d"], str):
+        return None
+    page, num = state.get("p"), state.get("n")
+    if any(isinstance(v, bool) or not isinstance(v, int) for v in (page, num)):
+        return None
+    if page < 1 or not (1 <= num <= MAX_PAGE_SIZE):
+        return None
+    return state
+
+
+async def fetch_share_page(
+    url: str,
+    password: str = "",
+    page: int = 1,
+    num: int = DEFAULT_PAGE_SIZE,
+    dir_path: Optional[str] = None,
+    cursor: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Fetch a single page of a share listing.
+
+    With a decoded `cursor` the share page is not scraped again and exactly
+    one /share/list request is made. Without one the tokens are scraped
+    first and, like fetch_download_link, a share whose first root item is
+    a directory is listed from inside that directory.
+
+    Returns {"files", "page", "num", "dir", "has_more", "next_cursor"} or
+    an error dict.
+    """
+    init_upstream()
+    try:
+        cookies = get_cookies()
+        async with aiohttp.ClientSession(cookies=cookies, headers=headers) as session:
+            if cursor is not None:
+                tokens = {
+                    "surl": cursor["s"],
+                    "request_url": cursor["r"],
+                    "js_token": cursor["t"],
+                    "log_id": cursor["l"],
+                }
+                page, num = cursor["p"], cursor["n"]
+                dir_path = cursor.get("d")
+                data = await fetch_share_list(
+                    session,
+                    tokens,
+                    share_list_params(tokens, password, page, num, dir_path),
+                )
+            else:
+                tokens = await fetch_share_tokens(session, url)
+                if "error" in tokens:
+                    return tokens
+
+                data = await fetch_share_list(
+                    session,
+                    tokens,
+                    share_list_params(
+                        tokens, password, page if dir_path else 1, num, dir_path
+                    ),
+                )
+                if "error" in data:
+                    return data
+
+                files = data["list"]
+                if not dir_path and files and files[0].get("isdir") == "1":
+                    dir_path = files[0]["path"]
+                    logging.info(f"Fetching directory contents: page {page}")
+                    data = await fetch_share_list(
+                        session,
+                        tokens,
+                        share_list_params(tokens, password, page, num, dir_path),
+                    )
+                elif not dir_path and page != 1:
+                    data = await fetch_share_list(
+                        session, tokens, share_list_params(tokens, password, page, num)
+                    )
+
+            if "error" in data:
+                return data
+
+            files = data["list"]
+            has_more = data.get("has_more")
+            if has_more is None:
+                has_more = len(files) >= num
+            has_more = bool(has_more) and bool(files)
+            logging.info(f"Found {len(files)} items on page {page}")
+
+            next_cursor = None
+            if has_more:
+                state = {
+                    "s": tokens["surl"],
+                    "r": tokens["request_url"],
+                    "t": tokens["js_token"],
+                    "l": tokens["log_id"],
+                    "p": page + 1,
+                    "n": num,
+                }
+                if dir_path:
+                    state["d"] = dir_path
+                next_cursor = encode_cursor(state)
+
+            return {
+                "files": files,
+                "page": page,
+                "num": num,
+                "dir": dir_path,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+            }
 
     except aiohttp.ClientResponseError as e:
         logging.error(f"HTTP error: {e.status} - {e.message}")
@@ -339,10 +717,12 @@ async def fetch_download_link(
         return {"error": str(e), "errno": -1}
 
 
-async def format_file_info(file_data: Dict[str, Any]) -> Dict[str, Any]:
+async def format_file_info(
+    file_data: Dict[str, Any], include_thumbnails: bool = True
+) -> Dict[str, Any]:
     """Format file information for API response"""
     thumbnails = {}
-    if "thumbs" in file_data:
+    if include_thumbnails and "thumbs" in file_data:
         for key, url in file_data["thumbs"].items():
             if url:
                 dimensions = extract_thumbnail_dimensions(url)
@@ -360,19 +740,51 @@ async def format_file_info(file_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+async def build_api2_item(
+    item: Dict[str, Any], direct_link: Optional[str]
+) -> Dict[str, Any]:
+    """Build a single /api2 file object from a raw share list item."""
+    thumbnails: Dict[str, str] = {}
+    thumb = (item.get("thumbs") or {}).get("url3")
+    if thumb:
+        thumbnails["original"] = thumb
+
+    formatted = {
+        "filename": item.get("server_filename", "Unknown"),
+        "size": await get_formatted_size(item.get("size", 0)),
+        "size_bytes": item.get("size", 0),
+        "download_link": direct_link or item.get("dlink") or "",
+        "is_directory": item.get("isdir") == "1",
+        "thumbnails": thumbnails,
+        "path": item.get("path", ""),
+        "fs_id": item.get("fs_id", ""),
+    }
+    if direct_link:
+        formatted["direct_link"] = direct_link
+    return formatted
+
+
 async def fetch_direct_links(
-    url: str, password: str = ""
+    url: str,
+    password: str = "",
+    files: Optional[List[Dict[str, Any]]] = None,
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-    """Fetch files with direct download links (alternative method)"""
+    """Fetch files with direct download links (alternative method).
+
+    Items are returned in the final /api2 response shape. An already
+    fetched share listing can be passed as `files` to skip the scrape.
+    """
 
     try:
-        files = await fetch_download_link(url, password)
+        if files is None:
+            files = await fetch_download_link(url, password)
 
         if isinstance(files, dict) and "error" in files:
             return files
 
         # Load cookies for the session (previous code referenced undefined `cookies`)
-        session_cookies = load_cookies()
+        init_upstream()
+        session_cookies = get_cookies()
 
         async with aiohttp.ClientSession(
             cookies=session_cookies,
@@ -404,16 +816,7 @@ async def fetch_direct_links(
                     except Exception as e:
                         logging.error(f"Error getting direct link: {e}")
 
-                results.append(
-                    {
-                        "filename": item.get("server_filename", "Unknown"),
-                        "size": await get_formatted_size(item.get("size", 0)),
-                        "size_bytes": item.get("size", 0),
-                        "link": dlink,
-                        "direct_link": direct_link,
-                        "thumbnail": (item.get("thumbs") or {}).get("url3", ""),
-                    }
-                )
+                results.append(await build_api2_item(item, direct_link))
 
             return results
 
@@ -423,58 +826,418 @@ async def fetch_direct_links(
         return {"error": str(e), "errno": -1}
 
 
-async def _gather_format_file_info(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+async def _gather_format_file_info(
+    files: List[Dict[str, Any]], include_thumbnails: bool = True
+) -> List[Dict[str, Any]]:
     """Helper to run format_file_info concurrently for a list of file dicts."""
-    tasks = [format_file_info(item) for item in files if isinstance(item, dict)]
+    tasks = [
+        format_file_info(item, include_thumbnails)
+        for item in files
+        if isinstance(item, dict)
+    ]
     if not tasks:
         return []
     results = await asyncio.gather(*tasks)
     return results
 
 
-async def _normalize_api2_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Normalize items returned by fetch_direct_links to the /api response shape."""
-    out: List[Dict[str, Any]] = []
-    for item in items or []:
-        try:
-            if not isinstance(item, dict):
+# =============== SHARE CACHE ===============
+
+# Successful share listings and direct-link results are cached in memory for
+# SHARE_CACHE_TTL seconds. Upstream calls are limited to UPSTREAM_CONCURRENCY
+# at a time across request threads and the prewarm worker.
+SHARE_CACHE_TTL = int(os.getenv("SHARE_CACHE_TTL", "300"))
+SHARE_CACHE_MAX_ENTRIES = int(os.getenv("SHARE_CACHE_MAX_ENTRIES", "512"))
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", "4"))
+
+_share_cache: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_share_cache_lock = threading.Lock()
+_upstream_slots = threading.BoundedSemaphore(max(UPSTREAM_CONCURRENCY, 1))
+
+
+def cache_get(kind: str, url: str, password: str) -> Optional[List[Dict[str, Any]]]:
+    key = (kind, share_id(url), password)
+    with _share_cache_lock:
+        entry = _share_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del _share_cache[key]
+            return None
+        return entry[1]
+
+
+def cache_put(
+    kind: str, url: str, password: str, value: List[Dict[str, Any]]
+) -> None:
+    now = time.time()
+    with _share_cache_lock:
+        _share_cache[(kind, share_id(url), password)] = (now + SHARE_CACHE_TTL, value)
+        if len(_share_cache) > SHARE_CACHE_MAX_ENTRIES:
+            for key in [k for k, v in _share_cache.items() if v[0] <= now]:
+                del _share_cache[key]
+        while len(_share_cache) > SHARE_CACHE_MAX_ENTRIES:
+            oldest = min(_share_cache, key=lambda k: _share_cache[k][0])
+            del _share_cache[oldest]
+
+
+def get_share_files(
+    url: str, password: str = "", refresh: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Cached, concurrency-limited wrapper around fetch_download_link."""
+    if not refresh:
+        cached = cache_get("files", url, password)
+        if cached is not None:
+            return cached
+
+    with _upstream_slots:
+        files = profiling.run_async(fetch_download_link(url, password))
+    if isinstance(files, list) and files:
+        cache_put("files", url, password, files)
+    return files
+
+
+def get_share_page(
+    url: str,
+    password: str = "",
+    page: int = 1,
+    num: int = DEFAULT_PAGE_SIZE,
+    dir_path: Optional[str] = None,
+    cursor: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Concurrency-limited wrapper around fetch_share_page (not cached)."""
+    with _upstream_slots:
+        return profiling.run_async(
+            fetch_share_page(url, password, page, num, dir_path, cursor)
+        )
+
+
+def get_direct_links(
+    url: str, password: str = "", refresh: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Cached, concurrency-limited wrapper around fetch_direct_links."""
+    if not refresh:
+        cached = cache_get("direct", url, password)
+        if cached is not None:
+            return cached
+
+    files = get_share_files(url, password, refresh)
+    if isinstance(files, dict) and "error" in files:
+        return files
+
+    with _upstream_slots:
+        items = profiling.run_async(fetch_direct_links(url, password, files))
+    if isinstance(items, list) and items:
+        cache_put("direct", url, password, items)
+    return items
+
+
+# =============== PREWARM ===============
+
+# Share links announced in advance can be resolved into the cache ahead of
+# the first user request and kept warm every PREWARM_INTERVAL seconds until
+# they expire. Targets come from PREWARM_URLS / PREWARM_FILE at startup or
+# from the /admin/prewarm endpoint.
+PREWARM_INTERVAL = int(os.getenv("PREWARM_INTERVAL", "240"))
+PREWARM_EXPIRY = int(os.getenv("PREWARM_EXPIRY", "86400"))
+
+# Refresh before cached entries expire, otherwise prewarmed links go cold
+# between refreshes.
+if PREWARM_INTERVAL >= SHARE_CACHE_TTL:
+    _refresh = max(int(SHARE_CACHE_TTL * 0.9), 1)
+    logging.warning(
+        f"PREWARM_INTERVAL ({PREWARM_INTERVAL}s) is not below SHARE_CACHE_TTL "
+        f"({SHARE_CACHE_TTL}s); refreshing prewarmed links every {_refresh}s instead"
+    )
+    PREWARM_INTERVAL = _refresh
+
+# Keyed by (share_id, password) so different URLs for one share collapse
+_prewarm_targets: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_prewarm_lock = threading.Lock()
+_prewarm_wakeup = threading.Event()
+_prewarm_thread: Optional[threading.Thread] = None
+
+
+def warm_share(url: str, password: str = "") -> bool:
+    """Resolve a share link and its direct links into the cache."""
+    result = get_direct_links(url, password, refresh=True)
+    if isinstance(result, dict) and "error" in result:
+        logging.warning(f"Prewarm failed for {url}: {result['error']}")
+        return False
+    logging.info(f"Prewarmed {url} ({len(result or [])} files)")
+    return True
+
+
+def _prewarm_loop() -> None:
+    global _prewarm_thread
+    while True:
+        now = time.time()
+        with _prewarm_lock:
+            for key in [k for k, t in _prewarm_targets.items() if t["expires_at"] <= now]:
+                del _prewarm_targets[key]
+            if not _prewarm_targets:
+                _prewarm_thread = None
+                return
+            due = [
+                (k, t["url"])
+                for k, t in _prewarm_targets.items()
+                if t["last_warmed"] + PREWARM_INTERVAL <= now
+            ]
+
+        for key, url in due:
+            try:
+                ok = warm_share(url, key[1])
+            except Exception as e:
+                logging.error(f"Prewarm error for {url}: {e}", exc_info=True)
+                ok = False
+            with _prewarm_lock:
+                target = _prewarm_targets.get(key)
+                if target is not None:
+                    target["last_warmed"] = time.time()
+                    target["ok"] = ok
+
+        # Clear before reading the targets so a set() from add_prewarm_targets
+        # after this point is not lost and wakes the wait below.
+        _prewarm_wakeup.clear()
+        with _prewarm_lock:
+            next_due = min(
+                (t["last_warmed"] + PREWARM_INTERVAL for t in _prewarm_targets.values()),
+                default=time.time(),
+            )
+        _prewarm_wakeup.wait(timeout=max(next_due - time.time(), 1))
+
+
+def add_prewarm_targets(
+    entries: List[Tuple[str, str]], expires_in: Optional[int] = None
+) -> List[str]:
+    """Register share links to keep warm and start the worker if needed.
+
+    Returns the URLs that were accepted; invalid share URLs are skipped.
+    """
+    global _prewarm_thread
+    expires_at = time.time() + (expires_in if expires_in is not None else PREWARM_EXPIRY)
+    accepted: List[str] = []
+    with _prewarm_lock:
+        for url, password in entries:
+            if not is_valid_share_url(url):
+                logging.warning(f"Ignoring invalid prewarm URL: {url}")
                 continue
-            filenamestr = item.get("filename") or item.get("server_filename", "Unknown")
-            size_h = (
-                item.get("size")
-                if isinstance(item.get("size"), str)
-                else await get_formatted_size(item.get("size", 0))
+            target = _prewarm_targets.setdefault(
+                (share_id(url), password), {"last_warmed": 0.0, "ok": None}
             )
-            size_b = item.get("size_bytes", item.get("size", 0))
-            download = (
-                item.get("direct_link")
-                or item.get("download_link")
-                or item.get("link")
-                or item.get("dlink")
-                or ""
+            target["url"] = url
+            target["expires_at"] = expires_at
+            accepted.append(url)
+        if accepted and _prewarm_thread is None:
+            _prewarm_thread = threading.Thread(
+                target=_prewarm_loop, name="prewarm", daemon=True
             )
-            thumbs: Dict[str, str] = {}
-            thumb_single = item.get("thumbnail") or (item.get("thumbs") or {}).get("url3")
-            if thumb_single:
-                thumbs["original"] = thumb_single
-            formatted = {
-                "filename": filenamestr,
-                "size": size_h,
-                "size_bytes": size_b,
-                "download_link": download,
-                "is_directory": item.get("is_directory", False),
-                "thumbnails": thumbs,
-                "path": item.get("path", ""),
-                "fs_id": item.get("fs_id", ""),
+            _prewarm_thread.start()
+    _prewarm_wakeup.set()
+    return accepted
+
+
+def prewarm_status() -> List[Dict[str, Any]]:
+    with _prewarm_lock:
+        return [
+            {
+                "url": t["url"],
+                "expires_at": datetime.utcfromtimestamp(t["expires_at"]).isoformat(),
+                "last_warmed": (
+                    datetime.utcfromtimestamp(t["last_warmed"]).isoformat()
+                    if t["last_warmed"]
+                    else None
+                ),
+                "ok": t["ok"],
             }
-            if item.get("direct_link"):
-                formatted["direct_link"] = item["direct_link"]
-            out.append(formatted)
-        except Exception:
+            for t in _prewarm_targets.values()
+        ]
+
+
+def parse_prewarm_lines(lines: List[str]) -> List[Tuple[str, str]]:
+    """Parse `url [pwd]` entries, ignoring blank lines and # comments."""
+    entries: List[Tuple[str, str]] = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
             continue
+        parts = line.split()
+        entries.append((parts[0], parts[1] if len(parts) > 1 else ""))
+    return entries
+
+
+def load_prewarm_config() -> List[Tuple[str, str]]:
+    """Read startup prewarm targets from PREWARM_URLS and PREWARM_FILE.
+
+    PREWARM_URLS holds comma-separated URLs; PREWARM_FILE points to a file
+    with one `url [pwd]` entry per line.
+    """
+    entries = parse_prewarm_lines(os.getenv("PREWARM_URLS", "").split(","))
+    file_path = os.getenv("PREWARM_FILE")
+    if file_path:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                entries.extend(parse_prewarm_lines(f.readlines()))
+        except Exception as e:
+            logging.warning(f"Failed to read '{file_path}': {e}")
+    return entries
+
+
+# Shared secret for admin routes (see auth.is_admin_request); they are
+# disabled when unset.
+app.config["ADMIN_TOKEN"] = os.getenv("ADMIN_TOKEN", "")
+
+
+# Keys of the file objects returned by /api; /api2 adds `direct_link`.
+API_FILE_FIELDS = (
+    "filename",
+    "size",
+    "size_bytes",
+    "download_link",
+    "is_directory",
+    "thumbnails",
+    "path",
+    "fs_id",
+)
+API2_FILE_FIELDS = API_FILE_FIELDS + ("direct_link",)
+
+
+def invalid_fields_response(
+    fields: Optional[set[str]], allowed: Tuple[str, ...], url: str
+) -> Optional[Tuple[Response, int]]:
+    """Return a 400 response if `fields` names unknown keys, else None."""
+    unknown = sorted(fields - set(allowed)) if fields else []
+    if not unknown:
+        return None
+    return (
+        jsonify(
+            {
+                "status": "error",
+                "message": f"Unknown fields: {', '.join(unknown)}",
+                "valid_fields": list(allowed),
+                "url": url,
+            }
+        ),
+        400,
+    )
+
+
+def parse_fields(raw: Optional[str]) -> Optional[set[str]]:
+    """Parse a comma-separated `fields=` query value into a set of keys"""
+    if not raw:
+        return None
+    fields = {f.strip() for f in raw.split(",") if f.strip()}
+    return fields or None
+
+
+def is_truthy(value: Optional[str]) -> bool:
+    return (value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def project_files(
+    files: List[Dict[str, Any]], fields: Optional[set[str]], compact: bool
+) -> List[Dict[str, Any]]:
+    """Keep only the requested keys of each file object.
+
+    With `fields` set, only those keys are returned. In compact mode the
+    `thumbnails` map is dropped unless it was explicitly requested.
+    """
+    if fields is None and not compact:
+        return files
+    out: List[Dict[str, Any]] = []
+    for item in files:
+        if fields is not None:
+            out.append({k: v for k, v in item.items() if k in fields})
+        else:
+            out.append({k: v for k, v in item.items() if k != "thumbnails"})
     return out
 
 
+# Cache lifetimes (seconds) for successful listing responses. `max-age`
+# applies to browsers/clients, `s-maxage` to shared caches such as the
+# Vercel edge network.
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", "60"))
+CDN_CACHE_MAX_AGE = int(os.getenv("CDN_CACHE_MAX_AGE", "300"))
+
+
+def compute_listing_etag(
+    files: List[Dict[str, Any]],
+    fields: Optional[set[str]],
+    compact: bool,
+    variant: str = "",
+    include_links: bool = False,
+) -> str:
+    """Compute a stable ETag for a share listing.
+
+    Every field of the (projected) file objects is hashed except the
+    re-signed download links and thumbnail URLs (only the thumbnail sizes
+    count), so renames and moves change the tag while the response
+    timestamp and link signatures do not. With `include_links` (used by
+    /api2, whose purpose is the short-lived signed links) `download_link`
+    and `direct_link` are hashed as well.
+    """
+    volatile = () if include_links else ("download_link", "direct_link")
+    digest = hashlib.sha1()
+    digest.update(",".join(sorted(fields)).encode() if fields else b"*")
+    digest.update(b"c" if compact else b"f")
+    digest.update(variant.encode())
+    for item in files:
+        digest.update(b"|")
+        for key in sorted(item):
+            if key in volatile:
+                continue
+            value = item[key]
+            if key == "thumbnails" and isinstance(value, dict):
+                value = sorted(value)
+            digest.update(f"{key}={value!r};".encode())
+    return digest.hexdigest()
+
+
+def set_listing_cache_headers(resp: Response, etag: str) -> Response:
+    resp.set_etag(etag, weak=True)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = CACHE_MAX_AGE
+    resp.cache_control.s_maxage = CDN_CACHE_MAX_AGE
+    # Also needed on 304s, which compress_response leaves untouched
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+def listing_response(
+    url: str,
+    files: List[Dict[str, Any]],
+    fields: Optional[set[str]],
+    compact: bool,
+    pagination: Optional[Dict[str, Any]] = None,
+    include_links: bool = False,
+) -> Response:
+    """Build a success response for a listing, honouring If-None-Match.
+
+    `pagination` (page, num, dir, has_more, next_cursor) is included in the
+    body for paged listings; `include_links` is passed to the ETag.
+    """
+    variant = ""
+    if pagination is not None:
+        variant = f"{pagination['page']}:{pagination['num']}:{pagination['dir']}:{pagination['has_more']}"
+    formatted_files = project_files(files, fields, compact)
+    etag = compute_listing_etag(
+        formatted_files, fields, compact, variant, include_links
+    )
+    if request.if_none_match.contains_weak(etag):
+        return set_listing_cache_headers(Response(status=304), etag)
+
+    payload: Dict[str, Any] = {
+        "status": "success",
+        "url": url,
+        "files": formatted_files,
+        "total_files": len(formatted_files),
+    }
+    if pagination is not None:
+        payload.update(pagination)
+    payload["timestamp"] = datetime.utcnow().isoformat()
+    return set_listing_cache_headers(jsonify(payload), etag)
+
+
 # =============== API ROUTES ===============
 
 
@@ -540,10 +1303,73 @@ def api():
             )
 
         password = request.args.get("pwd", "")
+        fields = parse_fields(request.args.get("fields"))
+        invalid = invalid_fields_response(fields, API_FILE_FIELDS, url)
+        if invalid:
+            return invalid
+        compact = is_truthy(request.args.get("compact"))
+        include_thumbnails = (
+            "thumbnails" in fields if fields is not None else not compact
+        )
         logging.info(f"API request for URL: {url}")
 
-        # Run async fetch in event loop
-        link_data = asyncio.run(fetch_download_link(url, password))
+        # Paged mode: one upstream /share/list page per request
+        pagination: Optional[Dict[str, Any]] = None
+        if any(k in request.args for k in ("page", "num", "cursor")):
+            cursor = None
+            if "cursor" in request.args:
+                if any(k in request.args for k in ("page", "num", "dir")):
+                    return (
+                        jsonify(
+                            {
+                                "status": "error",
+                                "message": "cursor cannot be combined with page, num or dir",
+                                "url": url,
+                            }
+                        ),
+                        400,
+                    )
+                cursor = decode_cursor(request.args["cursor"])
+                if cursor is None or not same_share(cursor["s"], extract_surl(url)):
+                    return (
+                        jsonify({"status": "error", "message": "Invalid cursor", "url": url}),
+                        400,
+                    )
+            try:
+                page = int(request.args.get("page", "1"))
+                num = int(request.args.get("num", str(DEFAULT_PAGE_SIZE)))
+            except ValueError:
+                return (
+                    jsonify(
+                        {
+                            "status": "error",
+                            "message": "page and num must be integers",
+                            "url": url,
+                        }
+                    ),
+                    400,
+                )
+            if page < 1 or not (1 <= num <= MAX_PAGE_SIZE):
+                return (
+                    jsonify(
+                        {
+                            "status": "error",
+                            "message": f"page must be >= 1 and num between 1 and {MAX_PAGE_SIZE}",
+                            "url": url,
+                        }
+                    ),
+                    400,
+                )
+
+            link_data = get_share_page(
+                url, password, page, num, request.args.get("dir") or None, cursor
+            )
+            if "error" not in link_data:
+                pagination = {k: v for k, v in link_data.items() if k != "files"}
+                link_data = link_data["files"]
+        else:
+            # Run async fetch in event loop (served from cache when warm)
+            link_data = get_share_files(url, password)
 
         # Check if error occurred
         if isinstance(link_data, dict) and "error" in link_data:
@@ -562,19 +1388,12 @@ def api():
                 status_code,
             )
 
-        # Format file information
-        if link_data:
-            formatted_files = asyncio.run(_gather_format_file_info(link_data))
-
-            return jsonify(
-                {
-                    "status": "success",
-                    "url": url,
-                    "files": formatted_files,
-                    "total_files": len(formatted_files),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+        # Format file information (an empty page is still a valid paged reply)
+        if link_data or pagination is not None:
+            formatted_files = profiling.run_async(
+                _gather_format_file_info(link_data, include_thumbnails)
             )
+            return listing_response(url, formatted_files, fields, compact, pagination)
         else:
             return (
                 jsonify({"status": "error", "message": "No files found", "url": url}),
@@ -623,8 +1442,13 @@ def api2():
         logging.info(f"API2 request for URL: {url}")
 
         password = request.args.get("pwd", "")
+        fields = parse_fields(request.args.get("fields"))
+        invalid = invalid_fields_response(fields, API2_FILE_FIELDS, url)
+        if invalid:
+            return invalid
+        compact = is_truthy(request.args.get("compact"))
 
-        link_data = asyncio.run(fetch_direct_links(url, password))
+        link_data = get_direct_links(url, password)
 
         # Check if error occurred
         if isinstance(link_data, dict) and "error" in link_data:
@@ -641,16 +1465,8 @@ def api2():
             )
 
         if link_data:
-            # Normalize file objects to match /api shape and include direct_link when available
-            formatted_files = asyncio.run(_normalize_api2_items(link_data))
-            return jsonify(
-                {
-                    "status": "success",
-                    "url": url,
-                    "files": formatted_files,
-                    "total_files": len(formatted_files),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+            return listing_response(
+                url, link_data, fields, compact, include_links=True
             )
         else:
             return (
@@ -666,6 +1482,63 @@ def api2():
         )
 
 
+@app.route("/admin/prewarm", methods=["GET", "POST"])
+def admin_prewarm():
+    """Register share links to prewarm (POST) or list current targets (GET).
+
+    POST body: {"urls": ["https://...", {"url": "https://...", "pwd": "..."}],
+    "expires_in": seconds}. Requires the ADMIN_TOKEN bearer token.
+    """
+    if not is_admin_request():
+        return jsonify({"status": "error", "message": "Unauthorized"}), 401
+
+    if request.method == "GET":
+        targets = prewarm_status()
+        return jsonify(
+            {"status": "success", "targets": targets, "total_targets": len(targets)}
+        )
+
+    body = request.get_json(silent=True) or {}
+    entries: List[Tuple[str, str]] = []
+    for entry in body.get("urls") or []:
+        if isinstance(entry, str):
+            entries.append((entry, ""))
+        elif isinstance(entry, dict) and entry.get("url"):
+            entries.append((str(entry["url"]), str(entry.get("pwd", ""))))
+    if not entries:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": "Missing required field: urls",
+                    "example": {"urls": ["https://teraboxshare.com/s/XXXXXXXX"]},
+                }
+            ),
+            400,
+        )
+
+    try:
+        expires_in = int(body["expires_in"]) if "expires_in" in body else None
+    except (TypeError, ValueError):
+        return (
+            jsonify({"status": "error", "message": "expires_in must be an integer"}),
+            400,
+        )
+
+    accepted = add_prewarm_targets(entries, expires_in)
+    return (
+        jsonify(
+            {
+                "status": "success",
+                "accepted": accepted,
+                "rejected": [u for u, _ in entries if u not in accepted],
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+        ),
+        202,
+    )
+
+
 @app.route("/help", methods=["GET"])
 def help_page():
     """Help and documentation endpoint"""
@@ -681,6 +1554,12 @@ def help_page():
                         "parameters": {
                             "url": "Required - TeraBox share link",
                             "pwd": "Optional - Password for protected links",
+                            "fields": "Optional - Comma-separated file keys to return (e.g. filename,size_bytes,download_link)",
+                            "compact": "Optional - 1 to omit thumbnails unless listed in fields",
+                            "page": "Optional - Return a single upstream page (1-based)",
+                            "num": f"Optional - Items per page (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})",
+                            "dir": "Optional - Directory path to list in paged mode",
+                            "cursor": "Optional - next_cursor from a previous paged response",
                         },
                         "example": "/api?url=https://teraboxshare.com/s/1ABC...",
                     },
@@ -690,6 +1569,8 @@ def help_page():
                         "parameters": {
                             "url": "Required - TeraBox share link",
                             "pwd": "Optional - Password for protected links",
+                            "fields": "Optional - Comma-separated file keys to return (e.g. filename,size_bytes,download_link)",
+                            "compact": "Optional - 1 to omit thumbnails unless listed in fields",
                         },
                         "example": "/api2?url=https://teraboxshare.com/s/1ABC...",
                     },
@@ -714,6 +1595,8 @@ def help_page():
                     },
                 },
                 "Notes": [
+                    "Responses are gzip/brotli compressed when the client sends Accept-Encoding",
+                    "Listing responses carry an ETag; send If-None-Match to get 304 Not Modified when unchanged",
                     "Cookies must be updated regularly (they expire)",
                     "Links requiring passwords need pwd parameter",
                     "Some links may require captcha verification",
@@ -725,5 +1608,11 @@ def help_page():
     )
 
 
+# Start keeping configured share links warm.
+_startup_prewarm = load_prewarm_config()
+if _startup_prewarm:
+    add_prewarm_targets(_startup_prewarm)
+
+
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=5000)
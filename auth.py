@@ -0,0 +1,28 @@
+"""
+Shared admin authentication for protected routes.
+
+The expected token is read from the app's `ADMIN_TOKEN` config value (set
+from the ADMIN_TOKEN environment variable). Admin routes are disabled when
+it is empty.
+"""
+
+from __future__ import annotations
+
+import hmac
+
+from flask import current_app, request
+
+__all__ = ["is_admin_request"]
+
+
+def is_admin_request() -> bool:
+    """Check the bearer token (or X-Admin-Token) against the app's ADMIN_TOKEN."""
+    expected = current_app.config.get("ADMIN_TOKEN") or ""
+    if not expected:
+        return False
+    header = request.headers.get("Authorization", "")
+    if header.startswith("Bearer "):
+        token = header[7:]
+    else:
+        token = request.headers.get("X-Admin-Token", "")
+    return hmac.compare_digest(token.encode(), expected.encode())
@@ -0,0 +1,91 @@
+"""Measure cold-start cost of the API entry point.
+
+Each run starts a fresh Python interpreter, imports `main` (which imports
+`api`) and issues a first request through Flask's test client, reporting:
+
+- import time of the entry point
+- latency of the first `/health` request
+- whether aiohttp had been imported by then
+- optionally, latency of the first `/api` request (`--url`, needs cookies)
+
+Usage:
+    python bench_startup.py --runs 5
+    python bench_startup.py --url https://teraboxshare.com/s/XXXXXXXX
+    LAZY_INIT=0 python bench_startup.py   # compare with eager initialisation
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+_CHILD = r"""
+import json, sys, time
+from urllib.parse import quote
+
+t0 = time.perf_counter()
+from main import app
+t1 = time.perf_counter()
+
+client = app.test_client()
+client.get("/health")
+t2 = time.perf_counter()
+
+result = {
+    "import_ms": (t1 - t0) * 1000,
+    "health_ms": (t2 - t1) * 1000,
+    "aiohttp_loaded": "aiohttp" in sys.modules,
+}
+
+url = sys.argv[1] if len(sys.argv) > 1 else ""
+if url:
+    t3 = time.perf_counter()
+    client.get("/api?url=" + quote(url, safe=""))
+    result["api_ms"] = (time.perf_counter() - t3) * 1000
+
+print(json.dumps(result))
+"""
+
+
+def run_once(url: Optional[str]) -> Dict[str, Any]:
+    here = os.path.dirname(os.path.abspath(__file__))
+    args = [sys.executable, "-c", _CHILD]
+    if url:
+        args.append(url)
+    proc = subprocess.run(
+        args, cwd=here, capture_output=True, text=True, check=True
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(label: str, values: List[float]) -> str:
+    return (
+        f"{label:<18} median {statistics.median(values):8.1f} ms"
+        f"   min {min(values):8.1f} ms   max {max(values):8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument("--url", default="", help="share URL for a first /api request")
+    opts = parser.parse_args()
+
+    results = [run_once(opts.url) for _ in range(opts.runs)]
+
+    print(f"LAZY_INIT={os.getenv('LAZY_INIT', '1')}  runs={opts.runs}")
+    print(summarize("import", [r["import_ms"] for r in results]))
+    print(summarize("first /health", [r["health_ms"] for r in results]))
+    if opts.url:
+        print(summarize("first /api", [r["api_ms"] for r in results]))
+    loaded = sum(1 for r in results if r["aiohttp_loaded"])
+    print(f"aiohttp loaded before first upstream call: {loaded}/{opts.runs}")
+
+
+if __name__ == "__main__":
+    main()
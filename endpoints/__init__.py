@@ -14,7 +14,10 @@ the core routes defined in the main application.
 from __future__ import annotations
 
 from datetime import datetime
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+
+import profiling
+from auth import is_admin_request
 
 # Public blueprint object imported by the app
 bp = Blueprint("endpoints", __name__, url_prefix="/v1")
@@ -39,6 +42,7 @@ def v1_index():
                 "/v1": "This metadata",
                 "/v1/health": "Health check for v1",
                 "/v1/echo": "Echo query parameters and selected headers",
+                "/v1/debug/profile": "Aggregated request profiles (admin, opt-in)",
             },
             "timestamp": _now_iso(),
         }
@@ -71,3 +75,41 @@ def v1_echo():
             "timestamp": _now_iso(),
         }
     )
+
+
+@bp.get("/debug/profile")
+def v1_debug_profile():
+    """Aggregated cProfile samples and event-loop lag (PROFILE_SAMPLE_RATE > 0).
+
+    Query parameters: `sort` (cumulative, tottime, ncalls), `limit`,
+    `format=text` for the pstats report and `reset=1` to clear samples
+    after reading them.
+    """
+    if not is_admin_request():
+        return jsonify({"status": "error", "message": "Unauthorized"}), 401
+    if not profiling.PROFILE_ENABLED:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": "Profiling is disabled; set PROFILE_SAMPLE_RATE to enable",
+                }
+            ),
+            404,
+        )
+
+    sort = request.args.get("sort", "cumulative")
+    try:
+        limit = max(int(request.args.get("limit", "30")), 1)
+    except ValueError:
+        limit = 30
+
+    if request.args.get("format") == "text":
+        resp = Response(profiling.profile_text(sort, limit), mimetype="text/plain")
+    else:
+        resp = jsonify(
+            {"status": "success", **profiling.profile_summary(sort, limit), "timestamp": _now_iso()}
+        )
+    if request.args.get("reset") == "1":
+        profiling.reset()
+    return resp
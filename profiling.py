@@ -0,0 +1,202 @@
+"""
+Opt-in profiling hooks for the request hot path.
+
+Profiling is enabled by setting PROFILE_SAMPLE_RATE to a value in (0, 1]:
+that fraction of requests is run under cProfile and the results are
+aggregated in memory. While enabled, every async upstream call also runs an
+event-loop lag monitor. Results are exposed by the `/v1/debug/profile`
+endpoint of the `endpoints` blueprint.
+
+When PROFILE_SAMPLE_RATE is unset or 0 no hooks are registered and
+`run_async` is `asyncio.run` itself, so there is no per-request overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, List, Optional, TypeVar
+
+from flask import Flask, g, request
+
+T = TypeVar("T")
+
+PROFILE_SAMPLE_RATE = min(float(os.getenv("PROFILE_SAMPLE_RATE", "0") or 0), 1.0)
+PROFILE_ENABLED = PROFILE_SAMPLE_RATE > 0
+# Seconds between event-loop lag probes while an async call is running.
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.05"))
+
+__all__ = [
+    "PROFILE_ENABLED",
+    "init_app",
+    "run_async",
+    "profile_summary",
+    "profile_text",
+    "reset",
+]
+
+_lock = threading.Lock()
+# cProfile can only be active once per process on newer Pythons, so at most
+# one sampled request is profiled at a time; others are simply not sampled.
+_profiler_slot = threading.Lock()
+_stats: Any = None
+_sampled: Dict[str, int] = {}
+_loop_lag: Deque[float] = deque(maxlen=1000)
+_loop_lag_max = 0.0
+
+# Label for requests that matched no route, so arbitrary paths cannot grow
+# the per-endpoint table.
+UNMATCHED_LABEL = "<unmatched>"
+# Reading the profile should not add to it.
+_SKIPPED_ENDPOINTS = {"endpoints.v1_debug_profile"}
+
+# Sort keys accepted by the summary, mapped to their pstats tuple column.
+_SORT_COLUMNS = {"ncalls": 1, "tottime": 2, "cumulative": 3}
+
+
+def init_app(app: Flask) -> None:
+    """Register sampling hooks on the app when profiling is enabled."""
+    if not PROFILE_ENABLED:
+        return
+
+    import cProfile
+
+    logging.info(f"Request profiling enabled (sample rate {PROFILE_SAMPLE_RATE})")
+
+    @app.before_request
+    def _start_profiler() -> None:
+        if request.endpoint in _SKIPPED_ENDPOINTS:
+            return
+        if random.random() >= PROFILE_SAMPLE_RATE:
+            return
+        if not _profiler_slot.acquire(blocking=False):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) is already active
+            _profiler_slot.release()
+            return
+        g._profiler = profiler
+
+    @app.teardown_request
+    def _stop_profiler(exc: Optional[BaseException]) -> None:
+        profiler = g.pop("_profiler", None)
+        if profiler is None:
+            return
+        profiler.disable()
+        _profiler_slot.release()
+        _record(profiler, request.endpoint or UNMATCHED_LABEL)
+
+
+def _record(profiler: Any, endpoint: str) -> None:
+    import pstats
+
+    global _stats
+    with _lock:
+        if _stats is None:
+            _stats = pstats.Stats(profiler)
+        else:
+            _stats.add(profiler)
+        _sampled[endpoint] = _sampled.get(endpoint, 0) + 1
+
+
+async def _monitor_loop_lag() -> None:
+    global _loop_lag_max
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        lag = max(loop.time() - start - LOOP_LAG_INTERVAL, 0.0)
+        with _lock:
+            _loop_lag.append(lag)
+            _loop_lag_max = max(_loop_lag_max, lag)
+
+
+async def _with_lag_monitor(coro: Awaitable[T]) -> T:
+    monitor = asyncio.ensure_future(_monitor_loop_lag())
+    try:
+        return await coro
+    finally:
+        monitor.cancel()
+
+
+def _run_monitored(coro: Awaitable[T]) -> T:
+    """Run a coroutine like asyncio.run while sampling event-loop lag."""
+    return asyncio.run(_with_lag_monitor(coro))
+
+
+run_async = _run_monitored if PROFILE_ENABLED else asyncio.run
+
+
+def profile_summary(sort: str = "cumulative", limit: int = 30) -> Dict[str, Any]:
+    """Return aggregated profile and loop-lag statistics as plain data."""
+    if sort not in _SORT_COLUMNS:
+        sort = "cumulative"
+    sort_index = _SORT_COLUMNS[sort]
+    with _lock:
+        rows: List[Dict[str, Any]] = []
+        if _stats is not None:
+            entries = sorted(
+                _stats.stats.items(), key=lambda kv: kv[1][sort_index], reverse=True
+            )
+            for (filename, line, func), (cc, nc, tt, ct, _) in entries[:limit]:
+                rows.append(
+                    {
+                        "function": f"{os.path.basename(filename)}:{line}({func})",
+                        "ncalls": nc,
+                        "primitive_calls": cc,
+                        "tottime_ms": round(tt * 1000, 3),
+                        "cumtime_ms": round(ct * 1000, 3),
+                    }
+                )
+        lags = sorted(_loop_lag)
+        loop_lag = {
+            "samples": len(lags),
+            "mean_ms": round(sum(lags) / len(lags) * 1000, 3) if lags else 0.0,
+            "p95_ms": (
+                round(lags[min(int(len(lags) * 0.95), len(lags) - 1)] * 1000, 3)
+                if lags
+                else 0.0
+            ),
+            "max_ms": round(_loop_lag_max * 1000, 3),
+        }
+        return {
+            "sample_rate": PROFILE_SAMPLE_RATE,
+            "sampled_requests": dict(_sampled),
+            "total_time_ms": round(_stats.total_tt * 1000, 3) if _stats else 0.0,
+            "sort": sort,
+            "functions": rows,
+            "event_loop_lag": loop_lag,
+        }
+
+
+def profile_text(sort: str = "cumulative", limit: int = 30) -> str:
+    """Return aggregated profile in pstats' text report format."""
+    import io
+
+    if sort not in _SORT_COLUMNS:
+        sort = "cumulative"
+
+    with _lock:
+        if _stats is None:
+            return "No samples collected yet.\n"
+        out = io.StringIO()
+        _stats.stream = out
+        _stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+def reset() -> None:
+    """Discard all collected samples."""
+    global _stats, _loop_lag_max
+    with _lock:
+        _stats = None
+        _sampled.clear()
+        _loop_lag.clear()
+        _loop_lag_max = 0.0